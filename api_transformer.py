@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Union
 import pandas as pd
 
 # Configure logging
@@ -9,6 +9,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger('api_transformer')
 
+# Keys every API document must contain
+REQUIRED_DOCUMENT_KEYS = ("applicationName", "formName", "Fields")
+
 class APITransformer:
     """
     Class for transforming data into API-ready format
@@ -28,14 +31,23 @@ class APITransformer:
         self.application_name = self.config.get('application_name', 'ENGINE')
         self.form_name = self.config.get('form_name', 'ENGINE_FIELD_SETTINGS')
         self.locale = self.config.get('locale', 'en')
+        
+        # Header shared by every document, copied for each row
+        self._doc_template = {
+            "applicationName": self.application_name,
+            "formName": self.form_name,
+            "phase": "",
+            "locale": self.locale
+        }
     
-    def transform_data(self, parsed_data: Dict[str, List[Dict[str, Any]]], 
+    def transform_data(self, parsed_data: Dict[str, Union[pd.DataFrame, List[Dict[str, Any]]]],
                        sheet_name: str = 'fields') -> Dict[str, List[Dict[str, Any]]]:
         """
         Transform parsed data into API-ready format
         
         Args:
-            parsed_data: Parsed data from Excel file
+            parsed_data: Parsed data from Excel file, either a DataFrame or a list
+                         of row dictionaries per sheet
             sheet_name: Name of the sheet containing fields to transform
             
         Returns:
@@ -45,63 +57,45 @@ class APITransformer:
             logger.warning(f"Sheet '{sheet_name}' not found in data")
             return {"Document": []}
             
-        api_data = {"Document": []}
         field_rows = parsed_data[sheet_name]
+        if isinstance(field_rows, pd.DataFrame):
+            field_names = list(field_rows.columns)
+            if field_names:
+                # Walk the rows as plain tuples, matched positionally with the column names
+                rows = (zip(field_names, row) for row in field_rows.itertuples(index=False, name=None))
+            else:
+                # itertuples yields nothing for a frame without columns, its rows have no fields
+                rows = [()] * len(field_rows)
+        else:
+            rows = (row.items() for row in field_rows)
         
         # Group rows by a common identifier (e.g. fieldName) if needed
         # For now, we'll create a separate document for each row
-        for row in field_rows:
-            document = self._create_document(row)
-            api_data["Document"].append(document)
+        api_data = {"Document": [self._create_document(row) for row in rows]}
             
         logger.info(f"Transformed {len(field_rows)} rows into {len(api_data['Document'])} API documents")
         return api_data
     
-    def _create_document(self, row_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_document(self, row_items: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
         """
         Create a document structure for a single row
         
         Args:
-            row_data: Data for a single row
+            row_items: (column name, value) pairs of a single row
             
         Returns:
             Document structure ready for API call
         """
-        # Extract field name for identification
-        field_name_key = next((k for k in row_data.keys() if k.lower().endswith('field_name')), '')
-        field_name = row_data.get(field_name_key, 'UNKNOWN')
+        isna = pd.isna
         
-        # Create document structure
-        document = {
-            "applicationName": self.application_name,
-            "formName": self.form_name,
-            "phase": "",
-            "locale": self.locale,
-            "Fields": []
-        }
-        
-        # Transform each field in the row to a Field entry
-        for key, value in row_data.items():
-            if value is None or pd.isna(value) or (isinstance(value, str) and not value.strip()):
-                continue
-            # Skip empty values
-            if value is None or (isinstance(value, str) and not value.strip()):
-                field_entry = {
-                    "fieldName": key
-                }
-            else:
-                # Convert to list for Values
-                if not isinstance(value, list):
-                    value = [str(value)]
-                else:
-                    value = [str(v) for v in value]
-                    
-                field_entry = {
-                    "fieldName": key,
-                    "Values": value
-                }
-                
-            document["Fields"].append(field_entry)
+        # Create document structure, skipping empty values
+        document = self._doc_template.copy()
+        document["Fields"] = [
+            {"fieldName": key, "Values": [str(value)]}
+            for key, value in row_items
+            # Most cells are strings, which only need the blank check
+            if (value.strip() if isinstance(value, str) else not (value is None or isna(value)))
+        ]
             
         return document
     
@@ -127,20 +121,20 @@ class APITransformer:
             
         # Check each document
         for i, doc in enumerate(transformed_data["Document"]):
-            # Check required keys
-            required_keys = ["applicationName", "formName", "Fields"]
-            missing_keys = [key for key in required_keys if key not in doc]
-            if missing_keys:
+            # Check required keys, listing the missing ones only on failure
+            if not all(key in doc for key in REQUIRED_DOCUMENT_KEYS):
+                missing_keys = [key for key in REQUIRED_DOCUMENT_KEYS if key not in doc]
                 logger.error(f"Document {i} is missing required keys: {missing_keys}")
                 return False
                 
             # Check if Fields is a list
-            if not isinstance(doc["Fields"], list):
+            fields = doc["Fields"]
+            if not isinstance(fields, list):
                 logger.error(f"Document {i}: 'Fields' must be a list")
                 return False
                 
             # Check each field entry
-            for j, field in enumerate(doc["Fields"]):
+            for j, field in enumerate(fields):
                 if "fieldName" not in field:
                     logger.error(f"Document {i}, Field {j} is missing 'fieldName'")
                     return False
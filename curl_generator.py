@@ -4,6 +4,12 @@ import base64
 import logging
 from typing import Dict, List, Any, Optional
 
+# orjson is optional, fall back to the standard library encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,6 +34,12 @@ class CURLGenerator:
         self.api_endpoint = api_endpoint
         self.username = username
         self.password = password
+        
+        # Credentials don't change, so encode the basic auth header once
+        self._auth_header = ""
+        if username and password:
+            encoded_auth = base64.b64encode(f"{username}:{password}".encode()).decode()
+            self._auth_header = f"-H 'Authorization: Basic {encoded_auth}' \\\n  "
     
     def generate_curl_commands(self, transformed_data: Dict[str, Any]) -> List[str]:
         """
@@ -56,32 +68,23 @@ class CURLGenerator:
         Returns:
             Curl command as string
         """
-        # Prepare the curl command
-        curl_command = [
-            "curl",
-            f"--url '{self.api_endpoint}'",
-            "-X POST",
-            "-H 'Content-Type: application/json'"
-        ]
-        
-        # Add basic auth if provided
-        if self.username and self.password:
-            auth_string = f"{self.username}:{self.password}"
-            encoded_auth = base64.b64encode(auth_string.encode()).decode()
-            curl_command.append(f"-H 'Authorization: Basic {encoded_auth}'")
-        
         # Add data with proper indentation for readability
         # Format JSON with 2 spaces of indentation
-        json_data = json.dumps(data, indent=2)
+        if orjson is not None:
+            json_data = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            json_data = json.dumps(data, indent=2, ensure_ascii=False)
         
         # Format the data part to be more readable in the curl command
         # Replace newlines with newline + spaces for proper shell script formatting
         formatted_data = json_data.replace('\n', '\n  ')
         
-        # Add the data part to the curl command
-        curl_command.append(f"--data '{formatted_data}'")
-        
-        return " \\\n  ".join(curl_command)
+        # Build the curl command with one option per continued line, adding basic auth if provided
+        return (
+            f"curl \\\n  --url '{self.api_endpoint}' \\\n  -X POST \\\n  "
+            f"-H 'Content-Type: application/json' \\\n  {self._auth_header}"
+            f"--data '{formatted_data}'"
+        )
     
     def save_curl_commands(self, commands: List[str], output_path: str) -> None:
         """
@@ -103,15 +106,14 @@ class CURLGenerator:
             os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
             
             logger.info(f"Saving curl commands to: {output_path}")
-            with open(output_path, 'w') as f:
-                # Add shebang and header
-                f.write("#!/bin/bash\n")
-                f.write("# Generated API calls\n\n")
-                
-                # Add each command with a separator
-                for i, command in enumerate(commands):
-                    f.write(f"# API Call {i+1}\n")
-                    f.write(f"{command}\n\n")
+            # Add shebang and header, then each command with a separator
+            script = "#!/bin/bash\n# Generated API calls\n\n" + "".join(
+                f"# API Call {i+1}\n{command}\n\n" for i, command in enumerate(commands)
+            )
+            
+            # Write the whole script in one call
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(script)
                     
             # Make the file executable
             os.chmod(output_path, 0o755)
@@ -1,7 +1,10 @@
 import pandas as pd
 import os
+import sys
 import logging
-from typing import Dict, List, Union, Any, Optional
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, List, Union, Any, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -10,6 +13,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger('excel_parser')
 
+# Use the native calamine reader when python-calamine is installed,
+# otherwise let pandas pick its default engine (openpyxl/xlrd)
+DEFAULT_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else None
+
 class ExcelParser:
     """
     Class for parsing Excel files into structured data
@@ -24,18 +31,24 @@ class ExcelParser:
                    - required_columns: List of required columns
                    - sheet_name: Default sheet name to read
                    - header_row: Row number to use as header (0-indexed)
+                   - engine: pandas Excel engine to read with (defaults to
+                     calamine when available)
+                   - max_workers: Number of threads used to read and clean
+                     sheets concurrently (defaults to 1, no threads)
         """
         self.config = config or {}
         self.required_columns = self.config.get('required_columns', [])
         self.default_sheet = self.config.get('sheet_name', 0)
         self.header_row = self.config.get('header_row', 0)
+        self.engine = self.config.get('engine', DEFAULT_ENGINE)
+        self.max_workers = self.config.get('max_workers', 1)
     
-    def read_excel_file(self, file_path: str, sheet_name: Optional[Union[str, int]] = None) -> Dict[str, pd.DataFrame]:
+    def read_excel_file(self, file_path: Union[str, BinaryIO], sheet_name: Optional[Union[str, int]] = None) -> Dict[str, pd.DataFrame]:
         """
         Read an Excel file and return dataframes for each sheet or specified sheet
         
         Args:
-            file_path: Path to the Excel file
+            file_path: Path to the Excel file, or a binary file-like object
             sheet_name: Name or index of the sheet to read, None reads all sheets
             
         Returns:
@@ -45,7 +58,8 @@ class ExcelParser:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file is not a valid Excel file
         """
-        if not os.path.exists(file_path):
+        is_path = isinstance(file_path, (str, os.PathLike))
+        if is_path and not os.path.exists(file_path):
             raise FileNotFoundError(f"Excel file not found: {file_path}")
         
         sheet_to_read = sheet_name if sheet_name is not None else None
@@ -53,21 +67,25 @@ class ExcelParser:
         try:
             logger.info(f"Reading Excel file: {file_path}, sheet: {sheet_to_read}")
             
-            # If sheet_to_read is None, read all sheets
-            if sheet_to_read is None:
-                excel_data = pd.read_excel(
-                    file_path, 
-                    sheet_name=None,  # Read all sheets
-                    header=self.header_row
-                )
-            else:
-                # Read specific sheet and return in the same dict format for consistency
-                df = pd.read_excel(
-                    file_path, 
-                    sheet_name=sheet_to_read,
-                    header=self.header_row
+            # Open the workbook once and parse the requested sheets from it
+            with pd.ExcelFile(file_path, engine=self.engine) as excel_file:
+                # If sheet_to_read is None, read all sheets
+                sheets = excel_file.sheet_names if sheet_to_read is None else [sheet_to_read]
+                # A file-like object can't be read from several threads at once
+                parallel = is_path and self._worker_count(sheets) > 1
+                if not parallel:
+                    excel_data = {
+                        sheet: excel_file.parse(sheet, header=self.header_row)
+                        for sheet in sheets
+                    }
+            
+            if parallel:
+                # Workbook handles can't be shared between threads, so each worker opens its own
+                frames = self._map_sheets(
+                    lambda sheet: pd.read_excel(file_path, sheet_name=sheet, header=self.header_row, engine=self.engine),
+                    sheets
                 )
-                excel_data = {sheet_to_read: df}
+                excel_data = dict(zip(sheets, frames))
             
             # Sheet name validation
             logger.info(f"Sheets found in Excel file: {list(excel_data.keys())}")
@@ -127,13 +145,41 @@ class ExcelParser:
         Returns:
             Dictionary of cleaned dataframes
         """
-        cleaned_dfs = {}
+        cleaned_dfs = self._map_sheets(self._clean_dataframe, list(dataframes.values()))
+        return dict(zip(dataframes.keys(), cleaned_dfs))
+    
+    def _worker_count(self, sheets: List[Any]) -> int:
+        """
+        Get the number of threads to use for processing the given sheets
         
-        for sheet_name, df in dataframes.items():
-            cleaned_df = self._clean_dataframe(df)
-            cleaned_dfs[sheet_name] = cleaned_df
+        Args:
+            sheets: Sheets to process
+            
+        Returns:
+            Number of worker threads, 1 when sheets are processed serially
+        """
+        return max(1, min(self.max_workers, len(sheets)))
+    
+    def _map_sheets(self, func: Callable[[Any], Any], sheets: List[Any]) -> List[Any]:
+        """
+        Apply a function to every sheet, using worker threads when configured
+        
+        Most of the time is spent in native pandas/reader code that releases
+        the GIL, so sheets can be processed concurrently.
+        
+        Args:
+            func: Function to apply to each sheet
+            sheets: Sheets to process
             
-        return cleaned_dfs
+        Returns:
+            Results in the same order as the sheets
+        """
+        workers = self._worker_count(sheets)
+        if workers == 1:
+            return [func(sheet) for sheet in sheets]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, sheets))
     
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -149,37 +195,50 @@ class ExcelParser:
         Returns:
             Cleaned DataFrame
         """
-        # Make a copy to avoid modifying the original
-        cleaned_df = df.copy()
+        # Drop rows that are all NaN, this returns a new frame so the original is left untouched
+        cleaned_df = df.dropna(how='all')
         
-        # Drop rows that are all NaN
-        cleaned_df = cleaned_df.dropna(how='all')
+        # Clean column names: strip whitespace and intern them, since they are
+        # used as dictionary keys for every row downstream
+        cleaned_df = cleaned_df.rename(columns=lambda col: sys.intern(str(col).strip()))
         
-        # Clean column names: strip whitespace and convert to lowercase
-        cleaned_df.columns = [str(col).strip() for col in cleaned_df.columns]
+        # Strip whitespace from string cells and blank out empty ones in one pass
+        text_columns = cleaned_df.select_dtypes(include=['object']).columns
+        if len(text_columns):
+            cleaned_df[text_columns] = cleaned_df[text_columns].apply(self._strip_strings)
         
-        # Strip whitespace from string columns
-        for col in cleaned_df.select_dtypes(include=['object']).columns:
-            cleaned_df[col] = cleaned_df[col].astype(str).str.strip()
-        
-        # Replace empty strings with NaN
-        cleaned_df = cleaned_df.replace('', pd.NA)
+        return cleaned_df
+    
+    @staticmethod
+    def _strip_strings(column: pd.Series) -> pd.Series:
+        """
+        Strip whitespace from the string cells of a column
         
-        # Fill NaN with None for better JSON serialization later
-        cleaned_df = cleaned_df.where(pd.notna(cleaned_df), None)
+        Args:
+            column: Object column to clean
+            
+        Returns:
+            Column with stripped strings, empty strings replaced by NaN
+        """
+        # The .str accessor is only available when the column holds strings
+        if pd.api.types.infer_dtype(column, skipna=True) not in ('string', 'mixed', 'mixed-integer'):
+            return column
         
-        return cleaned_df
+        stripped = column.str.strip()
+        # Non-string cells come back as NaN, keep their original value
+        stripped = stripped.where(stripped.notna(), column)
+        return stripped.mask(stripped == '')
     
-    def parse_excel(self, file_path: str, sheet_name: Optional[Union[str, int]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    def parse_dataframes(self, file_path: Union[str, BinaryIO], sheet_name: Optional[Union[str, int]] = None) -> Dict[str, pd.DataFrame]:
         """
-        Main method to parse Excel file(s) into a dictionary structure
+        Read, validate and clean Excel file(s) into dataframes
         
         Args:
-            file_path: Path to the Excel file
+            file_path: Path to the Excel file, or a binary file-like object
             sheet_name: Name or index of the sheet to read, None reads all sheets
             
         Returns:
-            Dictionary with sheet names as keys and lists of row dictionaries as values
+            Dictionary with sheet names as keys and cleaned dataframes as values
         """
         # Read Excel file
         dataframes = self.read_excel_file(file_path, sheet_name)
@@ -189,13 +248,28 @@ class ExcelParser:
             logger.warning("Data validation failed, but continuing with processing")
         
         # Clean data
-        cleaned_dfs = self.clean_dataframes(dataframes)
+        return self.clean_dataframes(dataframes)
+    
+    def parse_excel(self, file_path: Union[str, BinaryIO], sheet_name: Optional[Union[str, int]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Main method to parse Excel file(s) into a dictionary structure
+        
+        Args:
+            file_path: Path to the Excel file, or a binary file-like object
+            sheet_name: Name or index of the sheet to read, None reads all sheets
+            
+        Returns:
+            Dictionary with sheet names as keys and lists of row dictionaries as values
+        """
+        cleaned_dfs = self.parse_dataframes(file_path, sheet_name)
         
         # Convert dataframes to lists of dictionaries
         result = {}
         for sheet_name, df in cleaned_dfs.items():
-            # Convert to records (list of dicts)
-            records = df.to_dict(orient='records')
+            # Convert to records (list of dicts), using None for missing values
+            values = df.astype(object).where(df.notna(), None)
+            columns = tuple(values.columns)
+            records = [dict(zip(columns, row)) for row in values.itertuples(index=False, name=None)]
             result[sheet_name] = records
             
         return result
@@ -1,7 +1,9 @@
 import json
 import os
+import sys
 import logging
 from typing import Dict, Any, Optional
+import pandas as pd
 
 # Configure logging
 logging.basicConfig(
@@ -51,6 +53,12 @@ class FieldMapper:
             # Validate mapping format
             if not isinstance(self.mapping, dict):
                 raise ValueError("Mapping file must contain a JSON object")
+            
+            # Intern field names to match the interned column names from the parser
+            self.mapping = {
+                sys.intern(k): sys.intern(v) if isinstance(v, str) else v
+                for k, v in self.mapping.items()
+            }
                 
             logger.info(f"Loaded {len(self.mapping)} field mappings")
             return self.mapping
@@ -67,7 +75,8 @@ class FieldMapper:
         Apply field name mappings to parsed data
         
         Args:
-            data: Parsed data from Excel file (dictionary with sheet names as keys)
+            data: Parsed data from Excel file (dictionary with sheet names as keys
+                  and either a DataFrame or a list of row dictionaries as values)
             sheet_name: Name of the sheet containing fields to map
             
         Returns:
@@ -82,16 +91,30 @@ class FieldMapper:
             return data
             
         result = data.copy()
-        mapped_rows = []
+        sheet = data[sheet_name]
+        
+        # DataFrames only need their column labels renamed
+        if isinstance(sheet, pd.DataFrame):
+            result[sheet_name] = self._rename_columns(sheet)
+            logger.info(f"Applied field mapping to {len(sheet)} rows in sheet '{sheet_name}'")
+            return result
+        
+        # Resolve the field names of the first row once, rows of a sheet share their keys
+        lookup = self.mapping.get
+        mapped_fields = {field_name: lookup(field_name, field_name) for field_name in (sheet[0] if sheet else ())}
         
         # Map each row in the specified sheet
-        for row in data[sheet_name]:
-            mapped_row = {}
-            for field_name, field_value in row.items():
-                # Apply mapping if field exists in mapping dictionary
-                mapped_field = self.mapping.get(field_name, field_name)
-                mapped_row[mapped_field] = field_value
-            mapped_rows.append(mapped_row)
+        try:
+            mapped_rows = [
+                {mapped_fields[field_name]: field_value for field_name, field_value in row.items()}
+                for row in sheet
+            ]
+        except KeyError:
+            # Some rows have fields the first row lacks, look every name up instead
+            mapped_rows = [
+                {lookup(field_name, field_name): field_value for field_name, field_value in row.items()}
+                for row in sheet
+            ]
             
         # Replace original rows with mapped rows
         result[sheet_name] = mapped_rows
@@ -99,6 +122,30 @@ class FieldMapper:
         logger.info(f"Applied field mapping to {len(mapped_rows)} rows in sheet '{sheet_name}'")
         return result
     
+    def _rename_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Rename the columns of a DataFrame according to the mapping
+        
+        Columns mapped to the same name are merged the way row dictionaries
+        merge repeated keys: the column keeps the position of the first one
+        and the values of the last one.
+        
+        Args:
+            df: DataFrame whose columns to rename
+            
+        Returns:
+            DataFrame with mapped, unique column names
+        """
+        renamed = df.rename(columns=self.mapping)
+        columns = renamed.columns
+        if not columns.has_duplicates:
+            return renamed
+        
+        logger.warning(f"Several columns map to the same field, keeping the last of each: "
+                       f"{list(columns[columns.duplicated()].unique())}")
+        last_columns = renamed.iloc[:, ~columns.duplicated(keep='last')]
+        return last_columns[columns[~columns.duplicated()]]
+    
     def get_mapping(self) -> Dict[str, str]:
         """
         Get the current mapping dictionary
@@ -1,10 +1,17 @@
 import json
 import os
 import logging
-from typing import Dict, List, Any, Optional, Union
-from datetime import datetime, date
+from typing import Dict, List, Any, Optional, Tuple, Union
+from datetime import datetime, date, time
+import numpy as np
 import pandas as pd
 
+# orjson is optional, fall back to the standard library encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -12,6 +19,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger('json_converter')
 
+# Bound once so per-value checks skip the pd attribute lookup
+_isna = pd.isna
+
+# Leaf types that are never missing values and need no cleaning
+PLAIN_SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+# Date formats equal to a prefix of isoformat(), mapped to the prefix length
+ISO_DATE_FORMATS = {
+    '%Y-%m-%d': 10,
+    '%Y-%m-%dT%H:%M:%S': 19
+}
+
 class JSONConverter:
     """
     Class for converting structured data to JSON format
@@ -26,11 +45,39 @@ class JSONConverter:
                    - indent: Indentation level for JSON formatting
                    - date_format: Format string for date serialization
                    - flatten: Whether to flatten nested structures
+                   - skip_clean: Skip clean_json_data for data that is already
+                     clean, such as the output of ExcelParser.parse_excel
         """
         self.config = config or {}
         self.indent = self.config.get('indent', 2)
         self.date_format = self.config.get('date_format', '%Y-%m-%d')
         self.flatten = self.config.get('flatten', False)
+        self.skip_clean = self.config.get('skip_clean', False)
+        
+        # Length of the isoformat() prefix matching date_format, if it is an ISO format
+        self._iso_length = ISO_DATE_FORMATS.get(self.date_format)
+        
+        # Cleaners for the container types, looked up by exact type
+        self._clean_dispatch = {
+            dict: self._clean_dict,
+            list: self._clean_list,
+            tuple: self._clean_list,
+            pd.DataFrame: self._clean_frame
+        }
+        
+        # Output directories already created, so repeated saves skip makedirs
+        self._made_dirs = set()
+        
+        # orjson only supports 2-space indentation, other indents use the json module.
+        # Datetimes are passed through to _json_serializer so date_format still applies.
+        self._orjson_option = None
+        if orjson is not None and self.indent in (None, 2):
+            self._orjson_option = (
+                orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | (orjson.OPT_INDENT_2 if self.indent else 0)
+            )
     
     def convert_to_json(self, data: Any) -> str:
         """
@@ -43,6 +90,10 @@ class JSONConverter:
             JSON string representation of the data
         """
         try:
+            json_bytes = self._orjson_dumps(data)
+            if json_bytes is not None:
+                return json_bytes.decode('utf-8')
+            
             return json.dumps(
                 data,
                 indent=self.indent,
@@ -50,9 +101,30 @@ class JSONConverter:
                 ensure_ascii=False
             )
         except Exception as e:
-            logger.error(f"Error converting to JSON: {e}")
+            logger.error("Error converting to JSON: %s", e)
             raise ValueError(f"Failed to convert data to JSON: {e}")
     
+    def _orjson_dumps(self, data: Any) -> Optional[bytes]:
+        """
+        Serialize data with orjson when it is available and configured
+        
+        Args:
+            data: Data to convert to JSON
+            
+        Returns:
+            UTF-8 encoded JSON, or None if the json module has to be used instead
+        """
+        if self._orjson_option is None:
+            return None
+        
+        try:
+            return orjson.dumps(data, default=self._json_serializer, option=self._orjson_option)
+        except orjson.JSONEncodeError as e:
+            # orjson rejects some values the json module accepts, such as integers
+            # outside the 64-bit range, so retry those with the json module
+            logger.debug("orjson failed, falling back to json: %s", e)
+            return None
+    
     def _json_serializer(self, obj: Any) -> Any:
         """
         Custom JSON serializer to handle non-serializable types
@@ -63,12 +135,20 @@ class JSONConverter:
         Returns:
             JSON serializable representation of the object
         """
-        # Handle datetime objects
-        if isinstance(obj, (datetime, date)):
+        # Handle datetime objects, NaT is a datetime too but is handled below
+        if isinstance(obj, (datetime, date)) and obj is not pd.NaT:
+            # Slicing isoformat() is much faster than strftime for ISO formats,
+            # plain dates only have a date part to slice though
+            if self._iso_length == 10 or (self._iso_length and isinstance(obj, datetime)):
+                return obj.isoformat()[:self._iso_length]
             return obj.strftime(self.date_format)
+        
+        # Time-of-day cells have no date to format, write them like str() does
+        if isinstance(obj, time):
+            return obj.isoformat()
             
         # Handle pandas NaT, NaN, etc.
-        if pd.isna(obj):
+        if _isna(obj):
             return None
             
         # Handle other types as needed
@@ -86,17 +166,70 @@ class JSONConverter:
             IOError: If unable to write to the file
         """
         try:
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            self._ensure_directory(output_path)
             
-            logger.info(f"Saving JSON to: {output_path}")
+            logger.info("Saving JSON to: %s", output_path)
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(json_data)
                 
         except Exception as e:
-            logger.error(f"Error saving JSON to file: {e}")
+            logger.error("Error saving JSON to file: %s", e)
             raise IOError(f"Failed to save JSON to file: {e}")
     
+    def dump_json(self, data: Any, output_path: str) -> None:
+        """
+        Serialize data and write it straight to file, without building
+        an intermediate JSON string
+        
+        Args:
+            data: Data to convert to JSON
+            output_path: Path where to save the JSON file
+            
+        Raises:
+            ValueError: If the data can't be converted to JSON
+            IOError: If unable to write to the file
+        """
+        # orjson produces UTF-8 bytes that can be written as they are
+        json_bytes = self._orjson_dumps(data)
+        
+        try:
+            self._ensure_directory(output_path)
+            
+            logger.info("Saving JSON to: %s", output_path)
+            if json_bytes is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(json_bytes)
+            else:
+                # Let the json encoder write its chunks through a large buffer
+                with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    json.dump(
+                        data,
+                        f,
+                        indent=self.indent,
+                        default=self._json_serializer,
+                        ensure_ascii=False
+                    )
+                    
+        except (TypeError, ValueError) as e:
+            logger.error("Error converting to JSON: %s", e)
+            raise ValueError(f"Failed to convert data to JSON: {e}")
+        except Exception as e:
+            logger.error("Error saving JSON to file: %s", e)
+            raise IOError(f"Failed to save JSON to file: {e}")
+    
+    def _ensure_directory(self, output_path: str) -> None:
+        """
+        Create the directory of an output file if it doesn't exist
+        
+        Args:
+            output_path: Path of the file about to be written
+        """
+        # A bare file name means the current directory, which always exists
+        directory = os.path.dirname(output_path)
+        if directory and directory not in self._made_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._made_dirs.add(directory)
+    
     def validate_json(self, json_data: str) -> bool:
         """
         Validate JSON string
@@ -111,30 +244,144 @@ class JSONConverter:
             json.loads(json_data)
             return True
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON: {e}")
+            logger.error("Invalid JSON: %s", e)
             return False
     
     def clean_json_data(self, data: Any) -> Any:
         """
         Clean and normalize data before JSON conversion
         
+        Containers are walked iteratively, dispatching on the exact type of
+        each value. Leaves that may be pandas/numpy missing markers are checked
+        with a single vectorized pd.isna call, and DataFrames are converted to
+        records with clean_dataframe.
+        
         Args:
             data: Data to clean
             
         Returns:
             Cleaned data ready for JSON conversion
+            
+        Raises:
+            ValueError: If a container holds a reference to itself
         """
-        if isinstance(data, dict):
-            return {k: self.clean_json_data(v) for k, v in data.items() if k is not None}
+        root = [None]
+        # Leaf values and the (container, key) slot each one is written to
+        leaves = []
+        slots = []
+        stack = [(root, 0, data)]
+        # Ids of the containers whose items are still being walked
+        walking = set()
+        # Local names for the lookups made on every node
+        pop = stack.pop
+        plain_types = PLAIN_SCALAR_TYPES
+        dispatch = self._clean_dispatch
+        
+        while stack:
+            container, key, value = pop()
+            value_type = type(value)
             
-        elif isinstance(data, list):
-            return [self.clean_json_data(item) for item in data if item is not None]
+            if value_type in plain_types:
+                # A None container marks the end of the walk of container id key
+                if container is None:
+                    walking.discard(key)
+                else:
+                    container[key] = value
+                
+            elif value_type is float:
+                # NaN is the only value not equal to itself
+                container[key] = None if value != value else value
+                
+            elif value_type in dispatch or isinstance(value, (dict, list, tuple)):
+                # A container met again while its own items are walked contains itself
+                value_id = id(value)
+                if value_id in walking:
+                    raise ValueError("Circular reference detected")
+                walking.add(value_id)
+                # Queued below the items so it is popped once they are all handled
+                stack.append((None, value_id, None))
+                
+                handler = dispatch.get(value_type)
+                # Subclasses of the container types
+                if handler is None:
+                    handler = self._clean_dict if isinstance(value, dict) else self._clean_list
+                handler(value, container, key, stack)
+                
+            else:
+                container[key] = value
+                leaves.append(value)
+                slots.append((container, key))
+        
+        # Replace pandas NaN, NaT, NA etc. with None
+        if leaves:
+            missing = _isna(np.fromiter(leaves, dtype=object, count=len(leaves)))
+            for i in np.flatnonzero(missing):
+                container, key = slots[i]
+                container[key] = None
             
-        elif pd.isna(data):
-            return None
+        return root[0]
+    
+    @staticmethod
+    def clean_dataframe(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Convert a DataFrame to a list of row dictionaries ready for JSON conversion
+        
+        Missing values are replaced with None in one vectorized pass instead
+        of checking each cell separately.
+        
+        Args:
+            df: DataFrame to convert
             
-        # Convert any other types as needed
-        return data
+        Returns:
+            List of row dictionaries with None for missing values
+        """
+        return df.astype(object).where(df.notna(), None).to_dict(orient='records')
+    
+    def _clean_frame(self, value: pd.DataFrame, container: Any, key: Any, stack: List[Tuple[Any, Any, Any]]) -> None:
+        """
+        Write the cleaned records of a DataFrame into its slot
+        
+        Args:
+            value: DataFrame being cleaned
+            container: Container holding the records
+            key: Key or index of the records in container
+            stack: Work stack of (container, key, value) entries, unused as
+                   the records need no further cleaning
+        """
+        container[key] = self.clean_dataframe(value)
+    
+    @staticmethod
+    def _clean_dict(value: Dict[Any, Any], container: Any, key: Any, stack: List[Tuple[Any, Any, Any]]) -> None:
+        """
+        Copy a dictionary into its slot, dropping None keys, and queue its values
+        
+        Args:
+            value: Dictionary being cleaned
+            container: Container holding the cleaned copy
+            key: Key or index of the copy in container
+            stack: Work stack of (container, key, value) entries
+        """
+        cleaned = container[key] = {}
+        for k, v in value.items():
+            if k is not None:
+                # Reserve the key now so the original order is kept
+                cleaned[k] = None
+                stack.append((cleaned, k, v))
+    
+    @staticmethod
+    def _clean_list(value: List[Any], container: Any, key: Any, stack: List[Tuple[Any, Any, Any]]) -> None:
+        """
+        Copy a list into its slot, dropping None items, and queue its items
+        
+        Args:
+            value: List or tuple being cleaned
+            container: Container holding the cleaned copy
+            key: Key or index of the copy in container
+            stack: Work stack of (container, key, value) entries
+        """
+        items = [item for item in value if item is not None]
+        cleaned = container[key] = [None] * len(items)
+        stack.extend((cleaned, i, item) for i, item in enumerate(items))
     
     def flatten_json(self, data: Dict[str, Any], separator: str = '_') -> Dict[str, Any]:
         """
@@ -161,22 +408,35 @@ class JSONConverter:
             else:
                 result[parent_key] = current_data
         
-        _flatten(data)
+        # Top-level leaves, the whole row for flat sheet data, are copied directly
+        for key, value in data.items():
+            if isinstance(value, (dict, list)):
+                _flatten(value, key)
+            else:
+                result[key] = value
+                
         return result
     
-    def process_data(self, data: Any, output_path: Optional[str] = None) -> str:
+    def process_data(self, data: Any, output_path: Optional[str] = None,
+                     return_json: bool = True) -> Optional[str]:
         """
         Process data to JSON and optionally save to file
         
         Args:
             data: Data to convert to JSON
             output_path: Optional path to save the JSON file
+            return_json: Whether to return the JSON string. When False and an
+                         output path is given, the JSON is written straight to
+                         the file and None is returned
             
         Returns:
-            JSON string representation of the data
+            JSON string representation of the data, or None if not requested
+            
+        The serializer always produces well-formed JSON, so the output is not
+        re-parsed; use validate_json for JSON coming from other sources.
         """
-        # Clean the data
-        cleaned_data = self.clean_json_data(data)
+        # Clean the data, unless the source already guarantees it is clean
+        cleaned_data = data if self.skip_clean else self.clean_json_data(data)
         
         # Flatten if configured
         if self.flatten:
@@ -185,13 +445,14 @@ class JSONConverter:
             elif isinstance(cleaned_data, list) and all(isinstance(item, dict) for item in cleaned_data):
                 cleaned_data = [self.flatten_json(item) for item in cleaned_data]
         
+        # Write straight to file when the caller doesn't need the string
+        if output_path and not return_json:
+            self.dump_json(cleaned_data, output_path)
+            return None
+        
         # Convert to JSON
         json_data = self.convert_to_json(cleaned_data)
         
-        # Validate
-        if not self.validate_json(json_data):
-            raise ValueError("Generated JSON is invalid")
-        
         # Save if output path is provided
         if output_path:
             self.save_json(json_data, output_path)
@@ -4,7 +4,9 @@ import logging
 import json
 import getpass
 import sys
-from typing import Dict, Any, Optional
+import copy
+import functools
+from typing import Dict, Any, Optional, Union
 
 from excel_parser import ExcelParser
 from json_converter import JSONConverter
@@ -12,6 +14,12 @@ from field_mapper import FieldMapper
 from api_transformer import APITransformer
 from curl_generator import CURLGenerator
 
+# orjson is optional, fall back to the standard library parser without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,23 +27,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger('excel_to_json')
 
-def load_config(config_path: str) -> Dict[str, Any]:
+def load_config(config_path: Union[str, os.PathLike]) -> Dict[str, Any]:
     """
     Load configuration from JSON file
     
     Args:
-        config_path: Path to the configuration file
+        config_path: Path to the configuration file, as a string or path object
         
     Returns:
-        Configuration dictionary
+        Configuration dictionary, a fresh copy that the caller may modify
     """
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        # Plain string keys let str and Path callers share a cache entry
+        config_path = os.fspath(config_path)
+        # The modification time is part of the cache key so edited files are re-read.
+        # The cached dictionary is shared, so callers get their own copy of it
+        return copy.deepcopy(_read_config(config_path, os.stat(config_path).st_mtime_ns))
     except Exception as e:
-        logger.warning(f"Failed to load config file: {e}")
+        logger.warning("Failed to load config file: %s", e)
         return {}
 
+@functools.lru_cache(maxsize=16)
+def _read_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Read and parse a configuration file, cached per path and modification time
+    
+    Args:
+        config_path: Path to the configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+        
+    Returns:
+        Configuration dictionary, which must not be modified
+    """
+    with open(config_path, 'rb') as f:
+        buffer = f.read()
+    return orjson.loads(buffer) if orjson else json.loads(buffer)
+
 def excel_to_json(
     excel_path: str, 
     output_path: str, 
@@ -63,22 +90,23 @@ def excel_to_json(
     
     # Initialize components
     parser = ExcelParser(config=parser_config)
-    converter = JSONConverter(config=converter_config)
+    # ExcelParser already replaces missing values with None, so there is nothing to clean
+    converter = JSONConverter(config={'skip_clean': True, **converter_config})
     
     try:
         # Parse Excel file
-        logger.info(f"Parsing Excel file: {excel_path}")
+        logger.info("Parsing Excel file: %s", excel_path)
         parsed_data = parser.parse_excel(excel_path, sheet_name)
         
         # Convert to JSON and save
-        logger.info(f"Converting data to JSON and saving to: {output_path}")
-        json_data = converter.process_data(parsed_data, output_path)
+        logger.info("Converting data to JSON and saving to: %s", output_path)
+        converter.process_data(parsed_data, output_path, return_json=False)
         
         logger.info("Excel to JSON conversion completed successfully")
         return parsed_data
         
     except Exception as e:
-        logger.error(f"Excel to JSON conversion failed: {e}")
+        logger.error("Excel to JSON conversion failed: %s", e)
         raise
 
 def generate_api_calls(
@@ -122,12 +150,13 @@ def generate_api_calls(
     
     try:
         # Parse Excel file
-        logger.info(f"Parsing Excel file: {excel_path}")
-        parsed_data = parser.parse_excel(excel_path, sheet_name)
+        logger.info("Parsing Excel file: %s", excel_path)
+        # Keep the sheets as dataframes, the API pipeline never needs row dictionaries
+        parsed_data = parser.parse_dataframes(excel_path, sheet_name)
         
         # Apply field mapping if mapping file provided
         if mapping_file:
-            logger.info(f"Applying field mapping from: {mapping_file}")
+            logger.info("Applying field mapping from: %s", mapping_file)
             parsed_data = mapper.apply_mapping(parsed_data, sheet_name)
         
         # Transform data for API
@@ -148,14 +177,14 @@ def generate_api_calls(
         
         # Save curl commands if output path provided
         if output_curl:
-            logger.info(f"Saving curl commands to: {output_curl}")
+            logger.info("Saving curl commands to: %s", output_curl)
             curl_generator.save_curl_commands(curl_commands, output_curl)
         
         logger.info("API call generation completed successfully")
         return curl_commands[0] if curl_commands else ""
         
     except Exception as e:
-        logger.error(f"API call generation failed: {e}")
+        logger.error("API call generation failed: %s", e)
         raise
 
 def run_interactive_mode():
@@ -316,7 +345,7 @@ def main():
             )
             
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         exit(1)
 
 if __name__ == "__main__":
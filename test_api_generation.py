@@ -1,10 +1,12 @@
 import os
+import numpy as np
 import pandas as pd
 import json
 from excel_parser import ExcelParser
 from field_mapper import FieldMapper
 from api_transformer import APITransformer
 from curl_generator import CURLGenerator
+from main import generate_api_calls
 
 def create_test_excel(file_path):
     """
@@ -129,5 +131,85 @@ def test_api_generation():
     
     print("\nAll tests completed successfully!")
 
+def test_api_generation_empty_sheet(tmp_path):
+    """
+    Test that an empty fields sheet produces no documents and no curl commands
+    
+    Args:
+        tmp_path: Directory for the test Excel file
+    """
+    excel_path = os.path.join(tmp_path, 'test_empty_fields.xlsx')
+    
+    # Create a workbook whose fields sheet has no cells at all
+    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+        pd.DataFrame().to_excel(writer, sheet_name='fields', index=False)
+    
+    transformer = APITransformer()
+    assert transformer.transform_data({'fields': []}) == {"Document": []}, "Expected no documents for an empty row list"
+    
+    curl_command = generate_api_calls(excel_path, "https://api.example.com/endpoint")
+    assert curl_command == "", "Expected no curl command for an empty fields sheet"
+    
+    print("\nEmpty sheet test completed successfully!")
+
+def test_field_mapping_dataframe_matches_rows(tmp_path):
+    """
+    Test that mapping a DataFrame sheet gives the same API documents as mapping its rows
+    
+    Args:
+        tmp_path: Directory for the test mapping file
+    """
+    mapping_path = os.path.join(tmp_path, 'test_duplicate_mapping.json')
+    
+    # Two source columns mapped to the same field
+    with open(mapping_path, 'w') as f:
+        json.dump({'field_id': 'ENGINE_FIELD_NAME', 'old_name': 'ENGINE_DISPLAY_NAME', 'display_name': 'ENGINE_DISPLAY_NAME'}, f)
+    
+    df = pd.DataFrame({
+        'field_id': ['FIELD1', 'FIELD2', 'FIELD3'],
+        'old_name': ['Old One', 'Old Two', 'Old Three'],
+        'display_name': ['First Field', 'Second Field', None],
+        'field_type': ['Text', 'Number', 'Text']
+    })
+    rows = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+    
+    mapper = FieldMapper(mapping_path)
+    transformer = APITransformer()
+    frame_documents = transformer.transform_data(mapper.apply_mapping({'fields': df}), 'fields')
+    row_documents = transformer.transform_data(mapper.apply_mapping({'fields': rows}), 'fields')
+    
+    assert frame_documents == row_documents, "DataFrame and row mapping produced different documents"
+    
+    # Like a dictionary key, the repeated field appears once with the value of the last column
+    first_fields = frame_documents['Document'][0]['Fields']
+    assert [field['fieldName'] for field in first_fields] == ['ENGINE_FIELD_NAME', 'ENGINE_DISPLAY_NAME', 'field_type']
+    assert first_fields[1]['Values'] == ['First Field']
+    third_names = [field['fieldName'] for field in frame_documents['Document'][2]['Fields']]
+    assert 'ENGINE_DISPLAY_NAME' not in third_names, "Expected the empty last column to leave the field out"
+    
+    print("\nField mapping test completed successfully!")
+
+def test_transform_skips_blank_cells():
+    """
+    Test that missing and blank cells, including str subclasses like np.str_, produce no fields
+    """
+    rows = [{'a': 'x', 'b': ' ', 'c': np.str_(' '), 'd': np.str_('y'), 'e': None, 'f': float('nan'), 'g': 3}]
+    
+    fields = APITransformer().transform_data({'fields': rows})['Document'][0]['Fields']
+    assert fields == [
+        {'fieldName': 'a', 'Values': ['x']},
+        {'fieldName': 'd', 'Values': ['y']},
+        {'fieldName': 'g', 'Values': ['3']}
+    ], f"Unexpected fields for blank cells: {fields}"
+    
+    print("\nBlank cell test completed successfully!")
+
 if __name__ == "__main__":
+    # Create test directory
+    test_dir = os.path.join(os.getcwd(), 'test_output')
+    os.makedirs(test_dir, exist_ok=True)
+    
     test_api_generation()
+    test_api_generation_empty_sheet(test_dir)
+    test_field_mapping_dataframe_matches_rows(test_dir)
+    test_transform_skips_blank_cells()
@@ -1,73 +1,116 @@
+import io
 import os
-import json
+import mmap
+import datetime
+import ijson
+import numpy as np
 import pandas as pd
+import pytest
+from openpyxl import Workbook
 from excel_parser import ExcelParser
 from json_converter import JSONConverter
+from main import excel_to_json
 
-def create_test_excel(file_path):
+# Sample data for Sheet1, as typed column arrays
+SHEET1_DATA = {
+    'name': pd.array(['John Doe', 'Jane Smith', 'Robert Johnson'], dtype='string'),
+    'age': np.array([30, 25, 45], dtype=np.int64),
+    'email': pd.array(['john@example.com', 'jane@example.com', 'robert@example.com'], dtype='string'),
+    'start_date': np.array(['2020-01-15', '2021-03-10', '2019-11-05'], dtype='datetime64[ns]')
+}
+
+# Sample data for Sheet2, as typed column arrays
+SHEET2_DATA = {
+    'product': pd.array(['Laptop', 'Phone', 'Tablet', 'Monitor'], dtype='string'),
+    'category': pd.array(['Electronics', 'Electronics', 'Electronics', 'Electronics'], dtype='string'),
+    'price': np.array([1200.50, 800.75, 350.99, 250.50], dtype=np.float64),
+    'in_stock': np.array([True, True, False, True], dtype=np.bool_)
+}
+
+# Parser and converter shared by the tests, neither keeps per-file state
+PARSER = ExcelParser()
+CONVERTER = JSONConverter()
+
+def create_test_excel(file):
     """
     Create a test Excel file with sample data
     
     Args:
-        file_path: Path where to create the test Excel file
-    """
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
-    
-    # Create sample data for Sheet1
-    sheet1_data = {
-        'name': ['John Doe', 'Jane Smith', 'Robert Johnson'],
-        'age': [30, 25, 45],
-        'email': ['john@example.com', 'jane@example.com', 'robert@example.com'],
-        'start_date': pd.to_datetime(['2020-01-15', '2021-03-10', '2019-11-05'])
-    }
-    df1 = pd.DataFrame(sheet1_data)
-    
-    # Create sample data for Sheet2
-    sheet2_data = {
-        'product': ['Laptop', 'Phone', 'Tablet', 'Monitor'],
-        'category': ['Electronics', 'Electronics', 'Electronics', 'Electronics'],
-        'price': [1200.50, 800.75, 350.99, 250.50],
-        'in_stock': [True, True, False, True]
-    }
-    df2 = pd.DataFrame(sheet2_data)
-    
-    # Create Excel writer
-    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-        df1.to_excel(writer, sheet_name='Employees', index=False)
-        df2.to_excel(writer, sheet_name='Products', index=False)
-    
-    print(f"Test Excel file created at: {file_path}")
-
-def test_excel_to_json():
+        file: Binary file object, or path, to write the test Excel file to
     """
-    Test the Excel to JSON conversion
+    # Stream the rows straight into a write-only workbook
+    workbook = Workbook(write_only=True)
+    for sheet_name, sheet_data in (('Employees', SHEET1_DATA), ('Products', SHEET2_DATA)):
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(list(sheet_data))
+        # tolist() turns numpy scalars and datetime64 values into Python objects openpyxl can write
+        for row in zip(*(pd.Series(values).tolist() for values in sheet_data.values())):
+            worksheet.append(row)
+    workbook.save(file)
+
+def read_test_excel():
     """
-    # Create test directory
-    test_dir = os.path.join(os.getcwd(), 'test_output')
-    os.makedirs(test_dir, exist_ok=True)
+    Create the test Excel file in memory and return its contents
     
-    # Define file paths
-    excel_path = os.path.join(test_dir, 'test_data.xlsx')
-    json_path = os.path.join(test_dir, 'test_output.json')
+    Returns:
+        Contents of the test Excel file
+    """
+    buf = io.BytesIO()
+    create_test_excel(buf)
+    return buf.getvalue()
+
+def scan_json_sheets(json_path):
+    """
+    Stream a JSON file of sheets without loading it into memory
     
-    # Create test Excel file
-    create_test_excel(excel_path)
+    Args:
+        json_path: Path to a non-empty JSON file holding an object of sheets
+        
+    Returns:
+        Tuple of the top-level keys and whether any of them holds a non-empty list
+    """
+    sheet_keys = []
+    item_prefix = None
+    has_data = False
+    with open(json_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for prefix, event, value in ijson.parse(mm):
+            if prefix == '' and event == 'map_key':
+                sheet_keys.append(value)
+                item_prefix = None
+            elif event == 'start_array' and sheet_keys and prefix == sheet_keys[-1]:
+                # Events for the elements of this top-level list use this prefix
+                item_prefix = f'{prefix}.item'
+            elif prefix == item_prefix:
+                has_data = True
+    return sheet_keys, has_data
+
+@pytest.fixture(scope='module')
+def excel_fixture():
+    """
+    Contents of the test Excel file, built once in memory and shared by the tests in this module
+    """
+    return read_test_excel()
+
+def test_excel_to_json(excel_fixture, tmp_path):
+    """
+    Test the Excel to JSON conversion
     
-    # Initialize parser and converter
-    parser = ExcelParser()
-    converter = JSONConverter()
+    Args:
+        excel_fixture: Contents of the test Excel file
+        tmp_path: Directory for the JSON output
+    """
+    json_path = os.path.join(tmp_path, 'test_output.json')
     
     # Parse Excel
     print("Parsing Excel file...")
-    parsed_data = parser.parse_excel(excel_path)
+    parsed_data = PARSER.parse_excel(io.BytesIO(excel_fixture))
     
     # Check parsed data
     print("Checking parsed data...")
-    print(f"Available sheets: {list(parsed_data.keys())}")
     
     # Use the actual sheet names from the parsed data
-    sheet_names = list(parsed_data.keys())
+    sheet_names = tuple(parsed_data)
+    print(f"Available sheets: {sheet_names}")
     
     # Make sure we have at least one sheet
     assert len(sheet_names) > 0, "No sheets found in parsed data"
@@ -87,29 +130,22 @@ def test_excel_to_json():
     
     # Convert to JSON
     print("Converting data to JSON...")
-    json_data = converter.process_data(parsed_data, json_path)
+    json_data = CONVERTER.process_data(parsed_data, json_path)
     
     # Validate saved JSON file
     print("Validating saved JSON file...")
-    assert os.path.exists(json_path), f"JSON file not created at {json_path}"
+    # A single stat call shows the file exists (it raises otherwise) and has content
+    assert os.stat(json_path).st_size > 0, f"JSON file is empty at {json_path}"
     
-    # Read JSON file and validate content
-    with open(json_path, 'r') as f:
-        saved_json = json.load(f)
+    sheet_keys, json_data_found = scan_json_sheets(json_path)
     
-    print(f"JSON keys: {list(saved_json.keys())}")
+    print(f"JSON keys: {sheet_keys}")
     
     # The saved JSON might have different keys compared to original sheet names
     # Just check if we have the right number and structure of data
-    assert len(saved_json) > 0, "No data found in JSON"
+    assert len(sheet_keys) > 0, "No data found in JSON"
     
     # Validate structure without relying on exact sheet names
-    json_data_found = False
-    for sheet_key, data in saved_json.items():
-        if isinstance(data, list) and len(data) > 0:
-            json_data_found = True
-            break
-    
     assert json_data_found, "No valid data lists found in JSON"
     print("JSON validation passed")
 
@@ -117,5 +153,84 @@ def test_excel_to_json():
     
     print("All tests passed successfully!")
 
+def test_oversized_int(tmp_path):
+    """
+    Test that integers outside the 64-bit range are still written to JSON
+    
+    Args:
+        tmp_path: Directory for the test Excel file and the JSON output
+    """
+    excel_path = os.path.join(tmp_path, 'test_oversized_int.xlsx')
+    json_path = os.path.join(tmp_path, 'test_oversized_int.json')
+    
+    # A mixed column keeps its numbers, so 1e20 reaches the serializer as a Python int
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = 'ids'
+    for row in (['id'], [1e20], ['x']):
+        worksheet.append(row)
+    workbook.save(excel_path)
+    
+    excel_to_json(excel_path, json_path)
+    
+    with open(json_path, 'rb') as f:
+        assert list(ijson.items(f, 'ids.item.id')) == [10 ** 20, 'x'], "Oversized integer not written to JSON"
+    assert '100000000000000000000' in CONVERTER.convert_to_json({'id': 10 ** 20}), \
+        "Oversized integer not converted to JSON"
+    
+    print("Oversized integer test passed")
+
+def test_time_cells(tmp_path):
+    """
+    Test that time-of-day cells are written to JSON as ISO time strings
+    
+    Args:
+        tmp_path: Directory for the test Excel file and the JSON output
+    """
+    excel_path = os.path.join(tmp_path, 'test_time_cells.xlsx')
+    json_path = os.path.join(tmp_path, 'test_time_cells.json')
+    
+    # The blank cell keeps the column as objects, so the time reaches the serializer as is
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = 'times'
+    for row in (['t', 'n'], [datetime.time(10, 11, 12), 1], [None, 2], [datetime.time(8, 0), 3]):
+        worksheet.append(row)
+    workbook.save(excel_path)
+    
+    excel_to_json(excel_path, json_path)
+    
+    with open(json_path, 'rb') as f:
+        assert list(ijson.items(f, 'times.item.t')) == ['10:11:12', None, '08:00:00'], "Time cells not written as ISO times"
+    
+    print("Time cells test passed")
+
+def test_clean_json_data_references():
+    """
+    Test that self-containing data is rejected and shared containers are cleaned
+    """
+    cyclic_dict = {'a': 1}
+    cyclic_dict['self'] = cyclic_dict
+    cyclic_list = [1]
+    cyclic_list.append([cyclic_list])
+    for data in (cyclic_dict, cyclic_list):
+        with pytest.raises(ValueError, match='Circular reference'):
+            CONVERTER.clean_json_data(data)
+    
+    # The same container twice is not a cycle
+    shared = {'x': float('nan'), 'y': [1, None]}
+    assert CONVERTER.clean_json_data([shared, shared]) == [{'x': None, 'y': [1]}] * 2, \
+        "Shared container not cleaned like separate copies"
+    
+    print("Reference test passed")
+
 if __name__ == "__main__":
-    test_excel_to_json()
+    # Create test directory
+    test_dir = os.path.join(os.getcwd(), 'test_output')
+    os.makedirs(test_dir, exist_ok=True)
+    
+    excel_data = read_test_excel()
+    test_excel_to_json(excel_data, test_dir)
+    test_oversized_int(test_dir)
+    test_time_cells(test_dir)
+    test_clean_json_data_references()